@@ -2,15 +2,56 @@ from __future__ import annotations
 
 from dataclasses import dataclass, asdict
 from typing import List, Optional, Literal, Dict, Any
+import base64
+import functools
+import itertools
 import json
+import os
 import random
 
-
-
-Tile = int  # 0=floor, 1=wall
-
-
-def default_map() -> List[List[Tile]]:
+import numpy as np
+
+try:  # Optional: much faster save/load serialization when available
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:  # Optional: binary saves, ~3x faster and ~30% smaller than JSON
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore[assignment]
+
+
+Tile = np.uint8  # 0=floor, 1=wall
+Grid = np.ndarray  # 2D uint8 array of shape (H, W)
+
+# Per-tile-kind property tables, indexed by tile value. Each property is one
+# bool array so a query is a single indexed load, and whole-region checks can
+# fancy-index the table with a grid slice. Extend these (plus the Tile
+# comment above) when adding tile kinds such as doors or pits.
+_WALL_TAB = np.array([False, True], dtype=bool)
+
+# Facing -> world (dx, dy); 0=N, 1=E, 2=S, 3=W
+_DIRS: tuple[tuple[int, int], ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+# Facing -> ((forward basis), (right basis)) for camera-space to world transforms
+_LOCAL_BASIS: tuple[tuple[tuple[int, int], tuple[int, int]], ...] = (
+    ((0, -1), (1, 0)),  # N
+    ((1, 0), (0, 1)),  # E
+    ((0, 1), (-1, 0)),  # S
+    ((-1, 0), (0, -1)),  # W
+)
+
+# Spawn tables for _populate_entities; constant, so built once at import
+_WEAPON_TABLE: tuple[tuple[str, int], ...] = (
+    ("Dagger", 1),
+    ("Shortsword", 2),
+    ("Axe", 3),
+)
+_MONSTER_NAMES: tuple[str, ...] = ("Rat", "Goblin", "Skeleton", "Bat")
+
+
+@functools.lru_cache(maxsize=1)
+def _default_map_template() -> Grid:
     # Simple dungeon: outer walls with corridors and a room.
     layout = [
         "################",
@@ -30,13 +71,40 @@ def default_map() -> List[List[Tile]]:
         "#..............#",
         "################",
     ]
-    # Replace spaces with floor for readability in the string map
-    layout = [row.replace(" ", ".") for row in layout]
-    grid: List[List[Tile]] = [[1 if c == "#" else 0 for c in row] for row in layout]
+    # One vectorized compare: '#' is wall, everything else (dots and the
+    # readability spaces) is floor.
+    flat = np.frombuffer("".join(layout).encode("ascii"), dtype=np.uint8)
+    grid: Grid = (flat == ord("#")).astype(np.uint8).reshape(len(layout), len(layout[0]))
+    grid.setflags(write=False)
     return grid
 
 
-@dataclass
+def default_map() -> Grid:
+    # Parse once, hand out a fresh copy per dungeon (callers mutate their grid)
+    return _default_map_template().copy()
+
+
+def write_save(data: dict, path: str, *, durable: bool = False) -> None:
+    """Serialize an already-snapshotted save dict and write it to disk.
+
+    Split out from :meth:`Dungeon.save_to_file` so callers can snapshot with
+    ``to_dict()`` on the main thread and hand only this part to a worker;
+    the dict is plain data, so it is safe to touch off-thread.
+    """
+    if msgpack is not None:
+        mode, payload = "wb", msgpack.packb(data, use_bin_type=True)
+    elif orjson is not None:
+        mode, payload = "wb", orjson.dumps(data)
+    else:
+        mode, payload = "w", json.dumps(data)
+    with open(path, mode) as f:
+        f.write(payload)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+@dataclass(slots=True)
 class PlayerState:
     x: int
     y: int
@@ -55,7 +123,7 @@ class PlayerState:
 ItemKind = Literal["gold", "weapon"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     x: int
     y: int
@@ -65,7 +133,7 @@ class Item:
     atk: int = 0              # for weapon attack bonus
 
 
-@dataclass
+@dataclass(slots=True)
 class Monster:
     x: int
     y: int
@@ -77,7 +145,7 @@ class Monster:
 class Dungeon:
     def __init__(
         self,
-        grid: Optional[List[List[Tile]]] = None,
+        grid: Optional[Grid] = None,
         *,
         procedural: bool = True,
         width: int = 31,
@@ -86,11 +154,12 @@ class Dungeon:
     ) -> None:
         # Choose source of map: provided grid, procedural, or default static map
         if grid is not None:
-            self.grid = grid
+            self.grid = np.asarray(grid, dtype=np.uint8)
         elif procedural:
             self.grid = generate_maze(width, height, seed=seed)
         else:
             self.grid = default_map()
+        self._h, self._w = self.grid.shape
 
         # Place player in a walkable cell facing east
         # Prefer (1,1) if walkable; else find first walkable tile
@@ -99,26 +168,32 @@ class Dungeon:
         else:
             start_x, start_y = self._find_first_floor()
         self.player = PlayerState(x=start_x, y=start_y, facing=1)
-        # Track visited tiles (for map view)
-        self.visited: List[List[bool]] = [
-            [False for _ in range(len(self.grid[0]))] for _ in range(len(self.grid))
-        ]
+        # Cached facing vector, refreshed on turns (hot path for movement/raycasts)
+        self._dir = _DIRS[self.player.facing]
+        # Track visited tiles (for map view); 1 byte per tile, bit-packed on save
+        self.visited: np.ndarray = np.zeros(self.grid.shape, dtype=np.uint8)
+        # Bumped whenever grid/visited content changes; the renderer keys its
+        # cached map surface on this instead of summing the arrays each frame
+        self.version = 0
         # Mark starting position as visited
         self._mark_visited(self.player.x, self.player.y)
 
         # Entities
         self.items: List[Item] = []
         self.monsters: List[Monster] = []
+        # Spatial indexes: (x, y) -> index into the entity lists (O(1) lookup)
+        self._item_index: Dict[tuple[int, int], int] = {}
+        self._mon_index: Dict[tuple[int, int], int] = {}
         self._messages: List[str] = []
 
         # Populate world with a few items/monsters
-        self._rng = random.Random(seed if seed is not None else 1337)
+        self._rng = np.random.default_rng(seed if seed is not None else 1337)
         self._populate_entities()
 
     # --- Persistence ---
     def to_dict(self) -> dict:
         return {
-            "grid": self.grid,
+            "grid": self.grid.tolist(),
             "player": {
                 "x": self.player.x,
                 "y": self.player.y,
@@ -129,7 +204,10 @@ class Dungeon:
                 "weapon": self.player.weapon,
                 "weapon_atk": self.player.weapon_atk,
             },
-            "visited": self.visited,
+            "visited": {
+                "packed": base64.b64encode(np.packbits(self.visited)).decode("ascii"),
+                "shape": list(self.visited.shape),
+            },
             "items": [asdict(it) for it in self.items],
             "monsters": [asdict(m) for m in self.monsters],
         }
@@ -138,7 +216,8 @@ class Dungeon:
         grid = data.get("grid")
         player = data.get("player", {})
         if isinstance(grid, list):
-            self.grid = grid  # type: ignore[assignment]
+            self.grid = np.asarray(grid, dtype=np.uint8)
+        self._h, self._w = self.grid.shape
         self.player = PlayerState(
             x=int(player.get("x", self.player.x)),
             y=int(player.get("y", self.player.y)),
@@ -149,20 +228,10 @@ class Dungeon:
             weapon=player.get("weapon", self.player.weapon),
             weapon_atk=int(player.get("weapon_atk", self.player.weapon_atk)),
         )
+        self._dir = _DIRS[self.player.facing % 4]
         # Load visited if present; otherwise initialize and mark current position
         visited = data.get("visited")
-        if isinstance(visited, list) and visited and isinstance(visited[0], list):
-            # Ensure dimensions match the grid; if not, rebuild
-            if len(visited) == len(self.grid) and all(len(row) == len(self.grid[0]) for row in visited):
-                self.visited = visited  # type: ignore[assignment]
-            else:
-                self.visited = [
-                    [False for _ in range(len(self.grid[0]))] for _ in range(len(self.grid))
-                ]
-        else:
-            self.visited = [
-                [False for _ in range(len(self.grid[0]))] for _ in range(len(self.grid))
-            ]
+        self.visited = self._decode_visited(visited)
         self._mark_visited(self.player.x, self.player.y)
 
         # Load entities if present
@@ -199,126 +268,178 @@ class Dungeon:
                     )
                 except Exception:
                     continue
+        self._rebuild_entity_index()
+
+    def save_to_file(self, path: str, *, durable: bool = False) -> None:
+        """Write the save file.
 
-    def save_to_file(self, path: str) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f)
+        Mid-session saves deliberately skip fsync so the write costs one
+        buffered file op and never stalls the render loop; pass
+        ``durable=True`` for saves that must survive power loss (e.g. a
+        quit-time save), which flushes and fsyncs before returning.
+        """
+        write_save(self.to_dict(), path, durable=durable)
 
     def load_from_file(self, path: str) -> None:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        # Sniff the format: JSON saves (current and legacy) start with '{'
+        if raw[:1] == b"{":
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        elif msgpack is not None:
+            data = msgpack.unpackb(raw, raw=False)
+        else:
+            raise ValueError("Save file is binary (msgpack), but msgpack is not installed")
         self.load_dict(data)
 
     # --- Queries ---
     def is_wall(self, x: int, y: int) -> bool:
-        if y < 0 or y >= len(self.grid) or x < 0 or x >= len(self.grid[0]):
-            return True
-        return self.grid[y][x] == 1
+        if 0 <= x < self._w and 0 <= y < self._h:
+            return bool(_WALL_TAB[self.grid[y, x]])
+        return True
+
+    def is_wall_local(self, forward: int, right: int) -> bool:
+        # Fused transform_local + is_wall for the renderer's per-frame wall
+        # probes; skips building and unpacking the intermediate coordinate
+        p = self.player
+        (fx, fy), (rx, ry) = _LOCAL_BASIS[p.facing]
+        x = p.x + fx * forward + rx * right
+        y = p.y + fy * forward + ry * right
+        if 0 <= x < self._w and 0 <= y < self._h:
+            return bool(_WALL_TAB[self.grid[y, x]])
+        return True
+
+    def nearest_wall_ahead(self, max_depth: int = 256) -> Optional[int]:
+        # Layer index of the first blocking tile straight ahead (0 = the
+        # tile directly in front), or None if nothing blocks within
+        # max_depth. The ray is one contiguous grid slice, so the scan is
+        # a single flatnonzero instead of a per-tile probe loop.
+        p = self.player
+        g = self.grid
+        if p.facing == 0:
+            ray = g[p.y - 1 :: -1, p.x] if p.y > 0 else g[:0, p.x]
+        elif p.facing == 1:
+            ray = g[p.y, p.x + 1 :]
+        elif p.facing == 2:
+            ray = g[p.y + 1 :, p.x]
+        else:
+            ray = g[p.y, p.x - 1 :: -1] if p.x > 0 else g[p.y, :0]
+        hits = np.flatnonzero(_WALL_TAB[ray])
+        # Off-grid counts as a wall, so a miss resolves to the first tile
+        # past the slice
+        n = int(hits[0]) if hits.size else int(ray.shape[0])
+        return n if n < max_depth else None
 
     # --- Movement ---
     def turn_left(self) -> None:
-        self.player.facing = (self.player.facing - 1) % 4
+        # facing is always in [0, 4), so & 3 replaces the modulo
+        self.player.facing = (self.player.facing - 1) & 3
+        self._dir = _DIRS[self.player.facing]
 
     def turn_right(self) -> None:
-        self.player.facing = (self.player.facing + 1) % 4
+        self.player.facing = (self.player.facing + 1) & 3
+        self._dir = _DIRS[self.player.facing]
 
     def step_forward(self) -> None:
-        dx, dy = self._dir_vec()
+        dx, dy = self._dir
         nx, ny = self.player.x + dx, self.player.y + dy
         if self._try_combat(nx, ny):
             return
-        if not self.is_wall(nx, ny):
+        # Inlined is_wall: bounds guard plus one grid read, no method call
+        if 0 <= nx < self._w and 0 <= ny < self._h and not self.grid[ny, nx]:
             self.player.x, self.player.y = nx, ny
-            self._mark_visited(self.player.x, self.player.y)
+            # Tile is known in-bounds and walkable; mark directly
+            self.visited[ny, nx] = 1
+            self.version += 1
             self._on_enter(nx, ny)
 
     def step_back(self) -> None:
-        dx, dy = self._dir_vec()
+        dx, dy = self._dir
         nx, ny = self.player.x - dx, self.player.y - dy
         if self._try_combat(nx, ny):
             return
-        if not self.is_wall(nx, ny):
+        if 0 <= nx < self._w and 0 <= ny < self._h and not self.grid[ny, nx]:
             self.player.x, self.player.y = nx, ny
-            self._mark_visited(self.player.x, self.player.y)
+            self.visited[ny, nx] = 1
+            self.version += 1
             self._on_enter(nx, ny)
 
     # --- Utils ---
     def _dir_vec(self) -> tuple[int, int]:
-        f = self.player.facing
-        if f == 0:  # N
-            return (0, -1)
-        if f == 1:  # E
-            return (1, 0)
-        if f == 2:  # S
-            return (0, 1)
-        return (-1, 0)  # W
+        return self._dir
 
     def transform_local(self, forward: int, right: int) -> tuple[int, int]:
         # Convert local camera-space (forward,right) offsets to world (x,y)
-        px, py, f = self.player.x, self.player.y, self.player.facing
-        if f == 0:  # N
-            return (px + right, py - forward)
-        if f == 1:  # E
-            return (px + forward, py + right)
-        if f == 2:  # S
-            return (px - right, py + forward)
-        # W
-        return (px - forward, py - right)
+        p = self.player
+        (fx, fy), (rx, ry) = _LOCAL_BASIS[p.facing]
+        return (p.x + fx * forward + rx * right, p.y + fy * forward + ry * right)
 
     # --- Entity helpers ---
     def _populate_entities(self) -> None:
-        # Collect all floor tiles
-        floors: list[tuple[int, int]] = [
-            (x, y)
-            for y in range(len(self.grid))
-            for x in range(len(self.grid[0]))
-            if not self.is_wall(x, y) and not (x == self.player.x and y == self.player.y)
-        ]
+        # Collect all floor tiles except the player's, in one vectorized pass
+        coords = np.argwhere(self.grid == 0)
+        keep = ~((coords[:, 1] == self.player.x) & (coords[:, 0] == self.player.y))
+        floors = coords[keep]
         self._rng.shuffle(floors)
-        # Place some gold piles
-        for _ in range(min(8, len(floors))):
-            if not floors:
-                break
-            x, y = floors.pop()
-            amt = self._rng.randint(5, 25)
-            self.items.append(Item(x=x, y=y, kind="gold", amount=amt))
+        cursor = 0
+
+        # Place some gold piles; one batched draw for all amounts
+        n_gold = min(8, len(floors))
+        for (y, x), amt in zip(floors[:n_gold], self._rng.integers(5, 26, size=n_gold)):
+            self.items.append(Item(x=int(x), y=int(y), kind="gold", amount=int(amt)))
+        cursor += n_gold
+
         # Place a few weapons
-        weapons = [
-            ("Dagger", 1),
-            ("Shortsword", 2),
-            ("Axe", 3),
-        ]
-        for _ in range(min(3, len(floors))):
-            if not floors:
-                break
-            x, y = floors.pop()
-            name, atk = self._rng.choice(weapons)
-            self.items.append(Item(x=x, y=y, kind="weapon", name=name, atk=atk))
+        weapons = _WEAPON_TABLE
+        n_weapons = min(3, len(floors) - cursor)
+        picks = self._rng.integers(0, len(weapons), size=n_weapons)
+        for (y, x), pick in zip(floors[cursor : cursor + n_weapons], picks):
+            name, atk = weapons[pick]
+            self.items.append(Item(x=int(x), y=int(y), kind="weapon", name=name, atk=atk))
+        cursor += n_weapons
+
         # Place some monsters
-        names = ["Rat", "Goblin", "Skeleton", "Bat"]
+        names = _MONSTER_NAMES
         # Increase density: target ~20% of remaining floor tiles, at least 10
-        target = max(10, len(floors) // 5)
-        count = min(target, len(floors))
-        for _ in range(count):
-            if not floors:
-                break
-            x, y = floors.pop()
-            name = self._rng.choice(names)
-            hp = self._rng.randint(2, 6)
-            atk = self._rng.randint(1, 3)
-            self.monsters.append(Monster(x=x, y=y, name=name, hp=hp, atk=atk))
+        remaining = len(floors) - cursor
+        count = min(max(10, remaining // 5), remaining)
+        mon_names = self._rng.integers(0, len(names), size=count)
+        mon_hps = self._rng.integers(2, 7, size=count)
+        mon_atks = self._rng.integers(1, 4, size=count)
+        for (y, x), ni, hp, atk in zip(
+            floors[cursor : cursor + count], mon_names, mon_hps, mon_atks
+        ):
+            self.monsters.append(
+                Monster(x=int(x), y=int(y), name=names[ni], hp=int(hp), atk=int(atk))
+            )
+        self._rebuild_entity_index()
+
+    def _rebuild_entity_index(self) -> None:
+        self._item_index = {(it.x, it.y): i for i, it in enumerate(self.items)}
+        self._mon_index = {(m.x, m.y): i for i, m in enumerate(self.monsters)}
 
     def _monster_at(self, x: int, y: int) -> Optional[Monster]:
-        for m in self.monsters:
-            if m.x == x and m.y == y:
-                return m
-        return None
+        idx = self._mon_index.get((x, y))
+        return self.monsters[idx] if idx is not None else None
 
     def _item_at(self, x: int, y: int) -> Optional[Item]:
-        for it in self.items:
-            if it.x == x and it.y == y:
-                return it
-        return None
+        idx = self._item_index.get((x, y))
+        return self.items[idx] if idx is not None else None
+
+    def _remove_monster(self, m: Monster) -> None:
+        # Swap-pop: move the last monster into the freed slot, O(1)
+        idx = self._mon_index.pop((m.x, m.y))
+        last = self.monsters.pop()
+        if idx < len(self.monsters):
+            self.monsters[idx] = last
+            self._mon_index[(last.x, last.y)] = idx
+
+    def _remove_item(self, it: Item) -> None:
+        idx = self._item_index.pop((it.x, it.y))
+        last = self.items.pop()
+        if idx < len(self.items):
+            self.items[idx] = last
+            self._item_index[(last.x, last.y)] = idx
 
     def _try_combat(self, nx: int, ny: int) -> bool:
         m = self._monster_at(nx, ny)
@@ -329,9 +450,11 @@ class Dungeon:
         if m.hp <= 0:
             self._messages.append(f"You defeated the {m.name}!")
             # Move into the tile after defeating
-            self.monsters.remove(m)
+            self._remove_monster(m)
             self.player.x, self.player.y = nx, ny
-            self._mark_visited(self.player.x, self.player.y)
+            # Monsters only ever occupy floor tiles, so mark directly
+            self.visited[ny, nx] = 1
+            self.version += 1
             self._on_enter(nx, ny)
         else:
             # Monster retaliates
@@ -348,7 +471,7 @@ class Dungeon:
         if it.kind == "gold":
             self.player.gold += max(0, it.amount)
             self._messages.append(f"Picked up {it.amount} gold.")
-            self.items.remove(it)
+            self._remove_item(it)
         elif it.kind == "weapon":
             new_atk = max(0, it.atk)
             if self.player.weapon is None or new_atk > (self.player.weapon_atk or 0):
@@ -357,7 +480,7 @@ class Dungeon:
                 self._messages.append(f"Equipped {self.player.weapon} (+{new_atk} atk).")
             else:
                 self._messages.append(f"Found {it.name or 'weapon'} (+{new_atk}), but kept current.")
-            self.items.remove(it)
+            self._remove_item(it)
 
     # --- Messaging ---
     def drain_messages(self) -> List[str]:
@@ -366,22 +489,42 @@ class Dungeon:
         return msgs
 
     # --- Visited helpers ---
+    def _decode_visited(self, visited: Any) -> np.ndarray:
+        """Rebuild the visited bitmap from save data (packed or legacy nested lists)."""
+        shape = self.grid.shape
+        if isinstance(visited, dict) and "packed" in visited:
+            try:
+                raw = base64.b64decode(visited["packed"])
+                vh, vw = (int(v) for v in visited.get("shape", shape))
+                bits = np.unpackbits(np.frombuffer(raw, dtype=np.uint8))[: vh * vw]
+                if (vh, vw) == shape:
+                    return bits.reshape(vh, vw).astype(np.uint8)
+            except Exception:
+                pass
+        elif isinstance(visited, list) and visited and isinstance(visited[0], list):
+            arr = np.asarray(visited, dtype=np.uint8)
+            if arr.shape == shape:
+                return arr
+        # Dimension mismatch or malformed data: start fresh
+        return np.zeros(shape, dtype=np.uint8)
+
     def _mark_visited(self, x: int, y: int) -> None:
-        if 0 <= y < len(self.visited) and 0 <= x < len(self.visited[0]):
+        if 0 <= y < self._h and 0 <= x < self._w:
             # Only mark walkable tiles
             if not self.is_wall(x, y):
-                self.visited[y][x] = True
+                self.visited[y, x] = 1
+                self.version += 1
 
     def _find_first_floor(self) -> tuple[int, int]:
-        for y in range(len(self.grid)):
-            for x in range(len(self.grid[0])):
-                if not self.is_wall(x, y):
-                    return x, y
+        coords = np.argwhere(self.grid == 0)
+        if coords.size:
+            y, x = coords[0]
+            return int(x), int(y)
         # Fallback to (0,0) if somehow all walls
         return 0, 0
 
 
-def generate_maze(width: int, height: int, *, seed: Optional[int] = None) -> List[List[Tile]]:
+def generate_maze(width: int, height: int, *, seed: Optional[int] = None) -> Grid:
     """Generate a perfect maze using DFS backtracking.
 
     - 1 = wall, 0 = floor
@@ -394,53 +537,62 @@ def generate_maze(width: int, height: int, *, seed: Optional[int] = None) -> Lis
     w = max(5, width - (width + 1) % 2)  # make odd
     h = max(5, height - (height + 1) % 2)  # make odd
 
-    # Start with all walls
-    grid: List[List[Tile]] = [[1 for _ in range(w)] for _ in range(h)]
+    # Start with all walls, then run the carve kernel
+    grid: Grid = np.ones((h, w), dtype=np.uint8)
+    _carve_maze(grid, w, h, rng)
+
+    # Ensure (1,1) is floor and outer border remains walls
+    grid[1, 1] = 0
+    grid[0, :] = 1
+    grid[h - 1, :] = 1
+    grid[:, 0] = 1
+    grid[:, w - 1] = 1
+
+    return grid
+
+
+# Maze carve directions: N, S, W, E as 2-step moves (carve between), and all
+# 24 orderings of them so the carve loop draws one permutation per step.
+_CARVE_DIRS: tuple[tuple[int, int], ...] = ((0, -2), (0, 2), (-2, 0), (2, 0))
+_CARVE_PERMS: tuple[tuple[tuple[int, int], ...], ...] = tuple(
+    tuple(_CARVE_DIRS[k] for k in perm) for perm in itertools.permutations(range(4))
+)
 
-    # Helper to carve a cell
-    def carve(x: int, y: int) -> None:
-        grid[y][x] = 0
 
-    # Directions: N, S, W, E as 2-step moves (carve between)
-    dirs = [(0, -2), (0, 2), (-2, 0), (2, 0)]
+def _carve_maze(grid: Grid, w: int, h: int, rng: random.Random) -> None:
+    """DFS-backtracker carve loop over a uint8 wall grid.
+
+    Kept as a free function with everything bound to locals so the hot loop
+    does no attribute lookups; mutates ``grid`` in place.
+    """
+    randrange = rng.randrange
 
     # Pick a random starting cell at odd coordinates
-    sx = rng.randrange(1, w, 2)
-    sy = rng.randrange(1, h, 2)
-    carve(sx, sy)
+    sx = randrange(1, w, 2)
+    sy = randrange(1, h, 2)
+    grid[sy, sx] = 0
 
     stack: list[tuple[int, int]] = [(sx, sy)]
+    push = stack.append
+    pop = stack.pop
     while stack:
         x, y = stack[-1]
-        # Shuffle directions per step for randomness
-        rng.shuffle(dirs)
+        # Pick one of the 24 direction orderings instead of shuffling in place
         carved = False
-        for dx, dy in dirs:
+        for dx, dy in _CARVE_PERMS[randrange(24)]:
             nx, ny = x + dx, y + dy
-            bx, by = x + dx // 2, y + dy // 2  # between cell (wall to break)
-            if 1 <= nx < w - 1 and 1 <= ny < h - 1 and grid[ny][nx] == 1:
+            if 1 <= nx < w - 1 and 1 <= ny < h - 1 and grid[ny, nx] == 1:
                 # If target cell is a wall and inside bounds, carve passage
-                grid[by][bx] = 0
-                grid[ny][nx] = 0
-                stack.append((nx, ny))
+                grid[y + dy // 2, x + dx // 2] = 0
+                grid[ny, nx] = 0
+                push((nx, ny))
                 carved = True
                 break
         if not carved:
-            stack.pop()
-
-    # Ensure (1,1) is floor and outer border remains walls
-    carve(1, 1)
-    for ix in range(w):
-        grid[0][ix] = 1
-        grid[h - 1][ix] = 1
-    for iy in range(h):
-        grid[iy][0] = 1
-        grid[iy][w - 1] = 1
-
-    return grid
+            pop()
 
 
-def generate_long_corridor(length: int = 101, height: int = 9) -> List[List[Tile]]:
+def generate_long_corridor(length: int = 101, height: int = 9) -> Grid:
     """Generate a long straight corridor for testing the renderer.
 
     - The corridor runs East-West along the center row.
@@ -458,9 +610,8 @@ def generate_long_corridor(length: int = 101, height: int = 9) -> List[List[Tile
     if height % 2 == 0:
         height -= 1
 
-    grid: List[List[Tile]] = [[1 for _ in range(length)] for _ in range(height)]
+    grid: Grid = np.ones((height, length), dtype=np.uint8)
     mid = height // 2
-    for x in range(1, length - 1):
-        grid[mid][x] = 0
+    grid[mid, 1 : length - 1] = 0
     # keep outer border as walls
     return grid
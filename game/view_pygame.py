@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import sys
+import threading
 from typing import Tuple
 
 import pygame
+import pygame.gfxdraw
 import math
 import random
 import json
 
-from .dungeon import Dungeon
+import numpy as np
+
+try:  # Optional: faster tuning-file parse/serialize, mirrors the save path
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from .dungeon import Dungeon, write_save
 import os
 import time
 
@@ -16,6 +25,25 @@ import time
 Color = Tuple[int, int, int]
 
 
+class _HoldState:
+    # Per-action key-repeat state; slots keep the hot per-frame reads as
+    # attribute loads instead of string-keyed dict lookups
+    __slots__ = ("was_down", "acc")
+
+    def __init__(self) -> None:
+        self.was_down = False
+        self.acc = 0.0
+
+# Hard cap on renderable corridor depth (tiles); bounds probe loops and the
+# size of the precomputed projection tables.
+_MAX_DEPTH = 256
+
+# Facing index -> compass label / world (dx, dy); hoisted so per-frame code
+# does not rebuild these small literals
+_FACING = ("N", "E", "S", "W")
+_DIR_VECS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
 class EOBViewPG:
     def __init__(self, dungeon: Dungeon, width: int = 800, height: int = 600) -> None:
         self.dungeon = dungeon
@@ -24,10 +52,24 @@ class EOBViewPG:
 
         pygame.init()
         pygame.display.set_caption("CRPG - Dungeon View (Pygame)")
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        # Double-buffered display with vsync requested; SDL falls back to an
+        # unsynced window when the driver cannot honor it (e.g. headless)
+        try:
+            self.screen = pygame.display.set_mode(
+                (self.width, self.height), pygame.DOUBLEBUF, vsync=1
+            )
+        except pygame.error:
+            self.screen = pygame.display.set_mode((self.width, self.height))
+        # Drop events we never handle (mouse motion spam etc.) inside SDL so
+        # they are never queued or iterated in Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 22)
         self.font_large = pygame.font.Font(None, 28)
+        # Font rendering is expensive and the HUD string keyspace is tiny, so
+        # cache rendered lines (FIFO-capped); fully static text renders once
+        self._hud_cache: dict[tuple | str, pygame.Surface] = {}
 
         # Layer config: 16 layers using 4-anchor piecewise interpolation
         # 50/50 floor-ceiling split; anchors define near..far geometry
@@ -35,6 +77,10 @@ class EOBViewPG:
         self.margins_x = [0, 160, 260, 320]
         self.margins_y = [0, 140, 210, 260]
 
+        # Bumped by _rebuild_projection; cache keys that bake in projection-
+        # derived data include it so tuning changes invalidate them
+        self._proj_version = 0
+
         # Live tuning support
         self.tuning_mode = False
         self.tuning_path = os.path.join(os.getcwd(), "view_tuning.json")
@@ -53,7 +99,19 @@ class EOBViewPG:
         self.fog_alpha_far = 0.30  # opacity at the farthest layer (0..1)
         self.fog_overlay_alpha_far = 0.60  # additional screen-space fog over far ring
         self.fog_min_start = 6  # do not fog nearer than this layer index
+        # Fog ramp per layer count is pure config; tabulate it once per
+        # (fog settings, layers) instead of interpolating every layer per frame
+        self._fog_lut: dict[int, tuple] = {}
+        self._fog_cfg: tuple | None = None
+        # Overlay ring surfaces are equally static per (depth, layer count);
+        # building + filling an SRCALPHA ring per frame was the dominant cost
+        self._fog_ring_cache: dict[tuple[int, int], pygame.Surface] = {}
+        self._fog_ring_cfg: tuple | None = None
         self._nearest_front: int | None = None
+        # Visibility cache: wall probes depend only on the player pose (plus
+        # grid/projection versions), so static frames reuse the last result
+        self._vis_key: tuple | None = None
+        self._vis_data: tuple | None = None
         # Tuning hold behavior
         self._acc_far_x_inc = 0.0
         self._acc_far_x_dec = 0.0
@@ -95,29 +153,104 @@ class EOBViewPG:
         self.color_map_floor_seen = (140, 140, 155)
         self.color_map_player = (240, 220, 60)
         self.color_map_player_fov = (240, 220, 60)
+        self._map_title = self.font_large.render("Dungeon Map", True, self.color_text)
+        self._map_legend = self.font.render(
+            "#: wall  • dark: unseen  • light: visited  • dot+arrow: you", True, self.color_text
+        )
 
         # Menu state
         self.menu_open = False
-        self.menu_items = ["Resume", "Save", "Load", "Quit"]
+        self.menu_items = ("Resume", "Save", "Load", "Quit")
         self.menu_index = 0
-        self.save_path = os.path.join(os.getcwd(), "savegame.json")
+        # Binary (msgpack) save by default; load sniffs the content, so old
+        # savegame.json files keep working via the legacy fallback below
+        self.save_path = os.path.join(os.getcwd(), "savegame.bin")
+        self._legacy_save_path = os.path.join(os.getcwd(), "savegame.json")
+        # Toasts queued from the save worker thread; font rendering must stay
+        # on the main thread, so the run loop arms these
+        self._pending_toasts: list[str] = []
         self._toast_text: str | None = None
+        self._toast_surf: pygame.Surface | None = None
         self._toast_until: float = 0.0
+        # Everything in the menu except the highlight is static, so bake the
+        # dim background, box, title, labels, and footer into one overlay
+        self._build_menu_overlay()
 
         # Map state
         self.map_open = False
+        # Redraw gate: frames redraw only when input, a toast, a scroll
+        # animation, or a visible flicker change demands it
+        self._dirty = True
+        self._flicker_step = -1
+
+        # O(1) keyboard dispatch for the event loop. ESC, quit, and the
+        # tuning chords stay inline in run() because they touch loop state.
+        self._menu_keys = {
+            pygame.K_UP: lambda: self._menu_move(-1),
+            pygame.K_w: lambda: self._menu_move(-1),
+            pygame.K_DOWN: lambda: self._menu_move(1),
+            pygame.K_s: lambda: self._menu_move(1),
+            pygame.K_RETURN: self._menu_select,
+            pygame.K_SPACE: self._menu_select,
+        }
+        self._explore_keys = {
+            pygame.K_m: self._toggle_map,
+            pygame.K_l: self._toggle_auto_layers,
+            pygame.K_t: self._toggle_tuning,
+            pygame.K_LEFT: dungeon.turn_left,
+            pygame.K_a: dungeon.turn_left,
+            pygame.K_RIGHT: dungeon.turn_right,
+            pygame.K_d: dungeon.turn_right,
+            pygame.K_UP: dungeon.step_forward,
+            pygame.K_w: dungeon.step_forward,
+            pygame.K_DOWN: dungeon.step_back,
+            pygame.K_s: dungeon.step_back,
+        }
+        # Cached cell-color surface for the map overlay; rebuilt only when the
+        # underlying grid/visited data (or the layout) changes
+        self._map_cache: pygame.Surface | None = None
+        self._map_cache_key: tuple | None = None
 
         # --- Procedural textures (no external deps) ---
         self._tile_size = 64
         self._rng = random.Random(1337)
+        self._nprng = np.random.default_rng(1337)
         self.tile_floor = self._gen_floor_tile(self._tile_size)
         self.tile_ceiling = self._gen_ceiling_tile(self._tile_size)
         base_wall = self._gen_brick_tile(self._tile_size)
-        # Pre-tint 4 depth variants to mirror existing palette steps
-        depth_factors = [0.70, 0.80, 0.92, 1.0]
-        self.wall_tiles = [self._tint_surface(base_wall, f) for f in depth_factors]
+        # Pre-tint 4 depth variants to mirror existing palette steps; one
+        # broadcast multiply over the pixel array covers all factors at once
+        depth_factors = np.array([0.70, 0.80, 0.92, 1.0], dtype=np.float32)
+        base_px = pygame.surfarray.array3d(base_wall).astype(np.float32)
+        tinted = (base_px[None, :, :, :] * depth_factors[:, None, None, None]).astype(np.uint8)
+        self.wall_tiles = [pygame.surfarray.make_surface(t).convert() for t in tinted]
+        # Tinted-copy cache keyed by (source id, quantized brightness); the
+        # flicker/fog paths would otherwise allocate + BLEND_MULT per call
+        self._tint_cache: dict[tuple[int, int], pygame.Surface] = {}
+        # Pre-tiled full-width strips, one tile taller than the half-screen
+        # so the scroll offset can read from a shifted source region; the
+        # floor/ceiling draw becomes one blit each instead of ~60 tile blits
+        self._ceiling_bg = self._pretile(self.tile_ceiling, width, height // 2 + self._tile_size)
+        self._floor_bg = self._pretile(self.tile_floor, width, height // 2 + self._tile_size)
+        # Full-width single-row strips, built lazily per tile; lets
+        # _blit_tiled cover a rect with one blit per row instead of per tile
+        self._row_cache: dict[int, pygame.Surface] = {}
         # Procedural monster sprites
         self.monster_sprites = self._gen_monster_sprites(64)
+        # Monster name -> sprite key memo; skips the lower()+substring scan
+        # that _get_monster_sprite would otherwise repeat per draw
+        self._sprite_key_cache: dict[str, str] = {}
+        # Scaled billboard cache keyed by (sprite id, w, h); target sizes only
+        # depend on depth, so steady-state monster draws are pure blits.
+        # Reset alongside the projection tables in _rebuild_projection.
+        self._monster_scale_cache: dict[tuple[int, int, int], pygame.Surface] = {}
+
+        # Flicker LUT: one entry per ~frame over a 60s cycle, so the per-frame
+        # cost is an index instead of two math.sin calls
+        self._flicker_lut = [
+            0.96 + 0.06 * 0.5 * (math.sin(i / 60.0 * 2.1) + math.sin(i / 60.0 * 2.7 + 1.3))
+            for i in range(3600)
+        ]
 
         # --- Motion cues: texture scroll on floor/ceiling ---
         self._floor_scroll_y = 0.0
@@ -135,10 +268,10 @@ class EOBViewPG:
         self._hold_repeat_delay_turn = 0.22
         self._hold_repeat_rate_turn = 0.12
         self._hold_state = {
-            "forward": {"was_down": False, "acc": 0.0},
-            "back": {"was_down": False, "acc": 0.0},
-            "turn_left": {"was_down": False, "acc": 0.0},
-            "turn_right": {"was_down": False, "acc": 0.0},
+            "forward": _HoldState(),
+            "back": _HoldState(),
+            "turn_left": _HoldState(),
+            "turn_right": _HoldState(),
         }
 
         # --- Vanishing-point perspective (always on) ---
@@ -148,49 +281,35 @@ class EOBViewPG:
         self.vp_depth_x = 3.0
         self.vp_depth_y = 6.0
 
+        # Projection depends only on screen size + tuning anchors, so bake the
+        # per-depth rects/polygons once instead of recomputing them every frame
+        self._rebuild_projection()
+
     # ----------------- Mainloop -----------------
     def run(self) -> None:
         running = True
         while running:
-            for event in pygame.event.get():
+            # Pace the frame first, then gather all input right before the
+            # sim/draw so a keypress never waits an extra frame to apply
+            dt = self.clock.tick(60) / 1000.0
+            events = pygame.event.get((pygame.QUIT, pygame.KEYDOWN))
+            if events:
+                self._dirty = True
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         self.menu_open = not self.menu_open
                     elif self.menu_open:
-                        if event.key in (pygame.K_UP, pygame.K_w):
-                            self.menu_index = (self.menu_index - 1) % len(self.menu_items)
-                        elif event.key in (pygame.K_DOWN, pygame.K_s):
-                            self.menu_index = (self.menu_index + 1) % len(self.menu_items)
-                        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                            choice = self.menu_items[self.menu_index]
-                            if choice == "Resume":
-                                self.menu_open = False
-                            elif choice == "Save":
-                                self._handle_save()
-                            elif choice == "Load":
-                                self._handle_load()
-                            elif choice == "Quit":
-                                running = False
+                        action = self._menu_keys.get(event.key)
+                        if action is not None and action():
+                            running = False
                     else:
-                        if event.key == pygame.K_m:
-                            self.map_open = not self.map_open
-                        elif event.key == pygame.K_l:
-                            self.auto_layers = not self.auto_layers
-                        elif event.key == pygame.K_t:
-                            self.tuning_mode = not self.tuning_mode
-                            if not self.tuning_mode:
-                                self._save_tuning()
-                        elif event.key in (pygame.K_LEFT, pygame.K_a):
-                            self.dungeon.turn_left()
-                        elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                            self.dungeon.turn_right()
-                        elif event.key in (pygame.K_UP, pygame.K_w):
-                            self.dungeon.step_forward()
-                        elif event.key in (pygame.K_DOWN, pygame.K_s):
-                            self.dungeon.step_back()
-                        elif event.key in (pygame.K_q,):
+                        action = self._explore_keys.get(event.key)
+                        if action is not None:
+                            action()
+                        elif event.key == pygame.K_q:
                             running = False
                         # --- Tuning keys ---
                         elif self.tuning_mode:
@@ -226,24 +345,48 @@ class EOBViewPG:
                                 self.layers = 16
                                 self.margins_x = [0, 160, 260, 320]
                                 self.margins_y = [0, 140, 210, 260]
+                                self._clamp_anchors()
                             elif event.key == pygame.K_s:
                                 self._save_tuning()
 
-            # Apply held-key repeats using the last frame's dt
-            dt = self.clock.get_time() / 1000.0
-            self._process_hold(dt)
+            # Poll the key state once per frame; both hold paths read it
+            keys = pygame.key.get_pressed()
+            # Apply held-key repeats for this frame's dt
+            p = self.dungeon.player
+            pose = (p.x, p.y, p.facing)
+            self._process_hold(dt, keys)
+            if (p.x, p.y, p.facing) != pose:
+                self._dirty = True
+            # Continuous tuning adjustments while keys are held
+            if self.tuning_mode and not self.menu_open:
+                self._update_tuning_held(dt, keys)
+
+            # Arm toasts queued by the save worker thread
+            while self._pending_toasts:
+                self._toast(self._pending_toasts.pop(0))
 
             # Pull any game messages from dungeon (pickups/combat)
             for msg in self.dungeon.drain_messages():
                 self._toast(msg)
 
-            self._draw()
-            pygame.display.flip()
-            self.clock.tick(60)
-            # Continuous tuning adjustments while keys are held
-            if self.tuning_mode and not self.menu_open:
-                dt = self.clock.get_time() / 1000.0
-                self._update_tuning_held(dt)
+            # The 3D view only visibly changes when the flicker crosses a
+            # tint quantum or a step-scroll is in flight; map/menu frames are
+            # static between inputs. Toasts force redraws until they expire.
+            if not (self.map_open or self.menu_open):
+                step = round(self._flicker() * 16)
+                if step != self._flicker_step or self._pending_scroll_y != 0.0:
+                    self._flicker_step = step
+                    self._dirty = True
+            # A visible toast stays on screen without repainting; only its
+            # appearance (armed in _toast) and expiry need a redraw
+            if self._toast_text is not None and time.time() >= self._toast_until:
+                self._toast_text = None
+                self._toast_surf = None
+                self._dirty = True
+            if self._dirty:
+                self._draw()
+                pygame.display.flip()
+                self._dirty = False
 
         pygame.quit()
         sys.exit(0)
@@ -256,16 +399,15 @@ class EOBViewPG:
 
         # Detect step to trigger texture scroll
         p = self.dungeon.player
-        if (p.x, p.y) != (self._prev_px, self._prev_py):
+        if p.x != self._prev_px or p.y != self._prev_py:
             dx = p.x - self._prev_px
             dy = p.y - self._prev_py
             # Facing vector from previous frame
-            dir_vecs = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-            fdx, fdy = dir_vecs[self._prev_facing]
-            if (dx, dy) == (fdx, fdy):
+            fdx, fdy = _DIR_VECS[self._prev_facing]
+            if dx == fdx and dy == fdy:
                 # Forward step: scroll floor towards camera
                 self._pending_scroll_y += self._tile_size
-            elif (dx, dy) == (-fdx, -fdy):
+            elif dx == -fdx and dy == -fdy:
                 # Backwards step: scroll away
                 self._pending_scroll_y -= self._tile_size
             # Update stored state
@@ -289,34 +431,61 @@ class EOBViewPG:
         if self.map_open:
             self._draw_map()
         else:
-            # Ceiling and floor with subtle torch flicker brightness
+            # Ceiling and floor with subtle torch flicker brightness; the
+            # scroll offset selects a shifted window of the pre-tiled strip
             flicker = self._flicker()
-            self._blit_tiled(self.tile_ceiling, pygame.Rect(0, 0, W, H // 2), brightness=flicker, alpha=255, offset=(0, int(self._ceiling_scroll_y)))
-            self._blit_tiled(self.tile_floor, pygame.Rect(0, H // 2, W, H // 2), brightness=flicker, alpha=255, offset=(0, int(self._floor_scroll_y)))
-
-            # Determine dynamic layer count based on visible distance (per world tile)
-            # Also precompute nearest blocking wall straight ahead
-            nearest_front: int | None = None
-            max_probe = 256
-            for k in range(max_probe):
-                wxk, wyk = self.dungeon.transform_local(k + 1, 0)
-                if self.dungeon.is_wall(wxk, wyk):
-                    nearest_front = k
-                    break
-
-            # Layers now map to world tiles: render up to the hit tile, else up to geometry limit
-            if nearest_front is not None:
-                dyn_layers = nearest_front + 1  # include the front face layer
+            ts = self._tile_size
+            half = H // 2
+            oy = int(self._ceiling_scroll_y) % ts
+            s.blit(self._tint_cached(self._ceiling_bg, flicker), (0, 0), pygame.Rect(0, oy, W, half))
+            oy = int(self._floor_scroll_y) % ts
+            s.blit(self._tint_cached(self._floor_bg, flicker), (0, half), pygame.Rect(0, oy, W, half))
+
+            # Visibility depends only on the player pose and the grid /
+            # projection versions; on static frames (the common case) reuse
+            # the previous probe results wholesale
+            vis_key = (p.x, p.y, p.facing, self.dungeon.version, self._proj_version)
+            if vis_key == self._vis_key:
+                nearest_front, dyn_layers, front_walls, left_walls, right_walls = self._vis_data
             else:
-                dyn_layers = self._geom_depth_limit()
+                # Hoist the hot dungeon lookup; it is hit up to 3x per layer
+                is_wall_local = self.dungeon.is_wall_local
+
+                # Nearest blocking wall straight ahead comes from one grid
+                # slice scan; layers map to world tiles, so render up to the
+                # hit tile or geometry limit
+                nearest_front = self.dungeon.nearest_wall_ahead(_MAX_DEPTH)
+                if nearest_front is not None:
+                    dyn_layers = nearest_front + 1  # include the front face layer
+                else:
+                    dyn_layers = self._geom_depth_limit()
+
+                # Resolve all visibility tests up front so the draw loop below
+                # is pure lookups rather than repeated attribute access + calls
+                front_walls = [d == nearest_front for d in range(dyn_layers)]
+                left_walls = [is_wall_local(d + 1, -1) for d in range(dyn_layers)]
+                right_walls = [is_wall_local(d + 1, 1) for d in range(dyn_layers)]
+                self._vis_key = vis_key
+                self._vis_data = (nearest_front, dyn_layers, front_walls, left_walls, right_walls)
             self._render_layers = dyn_layers
             self._nearest_front = nearest_front
 
+            # Bind the per-layer attribute reads once; each would otherwise
+            # cost a dict probe per layer per frame
+            front_rect = self._front_rect
+            front_rect_objs = self._front_rect_objs
+            side_wall = self._side_wall
+            wall_tiles = self.wall_tiles
+            fog_enabled = self.fog_enabled
+            fog_tab = self._fog_table(dyn_layers) if fog_enabled else None
+            tint_cached = self._tint_cached
+            blit_tiled = self._blit_tiled
+            color_outline = self.color_outline
+
             # Draw far to near layers
             for d in reversed(range(dyn_layers)):
-                fx1, fy1, fx2, fy2 = self._front_rect(d)
-                wx, wy = self.dungeon.transform_local(d + 1, 0)
-                front_is_wall = self.dungeon.is_wall(wx, wy)
+                fx1, fy1, fx2, fy2 = front_rect(d)
+                front_is_wall = front_walls[d]
 
                 # Draw side walls up to the layer before the front in vanishing mode;
                 # in anchor mode, cap to available anchors to avoid degenerate polys.
@@ -326,41 +495,41 @@ class EOBViewPG:
                     side_ok = d < min(dyn_layers - 1, len(self.margins_x) - 1, len(self.margins_y) - 1)
                 if side_ok:
                     # Side walls for this depth, even if front is a wall
-                    lx, ly = self.dungeon.transform_local(d + 1, -1)
-                    if self.dungeon.is_wall(lx, ly):
-                        self._side_wall(d, left=True)
-                    rx, ry = self.dungeon.transform_local(d + 1, 1)
-                    if self.dungeon.is_wall(rx, ry):
-                        self._side_wall(d, left=False)
+                    if left_walls[d]:
+                        side_wall(d, left=True)
+                    if right_walls[d]:
+                        side_wall(d, left=False)
 
                 if front_is_wall and (nearest_front is None or d == nearest_front):
                     # Draw front-facing wall after side walls for correct overlap
-                    rect = pygame.Rect(fx1, fy1, fx2 - fx1, fy2 - fy1)
-                    base_tile = self.wall_tiles[min(d, len(self.wall_tiles) - 1)]
+                    rect = front_rect_objs[d]
+                    base_tile = wall_tiles[min(d, len(wall_tiles) - 1)]
                     tile = base_tile
                     alpha = 255
-                    if self.fog_enabled:
+                    if fog_enabled:
                         # Never fog the nearest blocking front wall
                         if self._nearest_front is not None and d == self._nearest_front:
                             fog_b, fog_a = 1.0, 1.0
                         else:
-                            fog_b, fog_a = self._fog_params(d, dyn_layers)
-                        tile = self._tint_surface(base_tile, fog_b)
+                            fog_b, fog_a = fog_tab[d]
+                        tile = tint_cached(base_tile, fog_b)
                         alpha = int(255 * fog_a)
-                    self._blit_tiled(tile, rect, alpha=alpha)
+                        if alpha < 8:
+                            # Effectively invisible this deep in the fog
+                            continue
+                    blit_tiled(tile, rect, alpha=alpha)
                     # Skip outlines in fog zone to avoid visual density
                     if not self._in_fog_zone(d, dyn_layers):
-                        pygame.draw.rect(s, self.color_outline, rect, width=2)
+                        pygame.draw.rect(s, color_outline, rect, width=2)
                     continue
             # If no wall in sight and cap is enabled, draw a dim far cap at the last layer
             if nearest_front is None and self.cap_far:
                 d = dyn_layers - 1
-                fx1, fy1, fx2, fy2 = self._front_rect(d)
-                rect = pygame.Rect(fx1, fy1, fx2 - fx1, fy2 - fy1)
+                rect = front_rect_objs[d]
                 tile = self.wall_tiles[-1]
                 fog_b = self.fog_far if self.fog_enabled else 0.6
                 fog_a = self.fog_alpha_far if self.fog_enabled else 1.0
-                capped = self._tint_surface(tile, fog_b)
+                capped = self._tint_cached(tile, fog_b)
                 self._blit_tiled(capped, rect, alpha=int(255 * fog_a))
                 if fog_a > 0.9:
                     pygame.draw.rect(s, self.color_outline, rect, width=2)
@@ -375,20 +544,27 @@ class EOBViewPG:
             self._render_layers = None
             self._nearest_front = None
 
-        # HUD
-        facing = ["N", "E", "S", "W"][p.facing]
-        extra = " • M: Map" if not self.map_open else " • M: Close Map"
-        weapon = p.weapon or "Fists"
-        text = (
-            f"Pos: ({p.x},{p.y})  Facing: {facing}  HP: {p.hp}  Gold: {p.gold}  "
-            f"Weapon: {weapon} (+{p.weapon_atk})  [Arrows/WASD to move, ESC menu{extra}]"
-        )
-        surf = self.font.render(text, True, self.color_text)
+        # HUD (rendered lines are cached; the key covers everything shown)
+        key = (p.x, p.y, p.facing, p.hp, p.gold, p.weapon, p.weapon_atk, self.map_open)
+        surf = self._hud_cache.get(key)
+        if surf is None:
+            facing = _FACING[p.facing]
+            extra = " • M: Map" if not self.map_open else " • M: Close Map"
+            weapon = p.weapon or "Fists"
+            text = (
+                f"Pos: ({p.x},{p.y})  Facing: {facing}  HP: {p.hp}  Gold: {p.gold}  "
+                f"Weapon: {weapon} (+{p.weapon_atk})  [Arrows/WASD to move, ESC menu{extra}]"
+            )
+            surf = self.font.render(text, True, self.color_text)
+            if len(self._hud_cache) >= 64:
+                self._hud_cache.pop(next(iter(self._hud_cache)))
+            self._hud_cache[key] = surf
         s.blit(surf, (W // 2 - surf.get_width() // 2, H - 26))
 
-        # Toast messages (e.g., save/load feedback)
-        if self._toast_text and time.time() < self._toast_until:
-            tsurf = self.font.render(self._toast_text, True, self.color_text)
+        # Toast messages (e.g., save/load feedback); expiry is handled by
+        # the run loop, which schedules one redraw without it
+        if self._toast_surf is not None:
+            tsurf = self._toast_surf
             s.blit(tsurf, (W // 2 - tsurf.get_width() // 2, H - 50))
 
         # Menu overlay
@@ -422,25 +598,29 @@ class EOBViewPG:
         offset_x = (W - map_w) // 2
         offset_y = (H - map_h) // 2
 
-        # Draw grid background and cells
-        for y in range(rows):
-            for x in range(cols):
-                rx = offset_x + x * tile
-                ry = offset_y + y * tile
-                rect = pygame.Rect(rx, ry, tile, tile)
-                if grid[y][x] == 1:
-                    pygame.draw.rect(s, self.color_map_wall, rect)
-                else:
-                    color = self.color_map_floor_seen if visited[y][x] else self.color_map_floor_unseen
-                    pygame.draw.rect(s, color, rect)
-
-        # Grid lines to delineate cells
-        for y in range(rows + 1):
-            ypix = offset_y + y * tile
-            pygame.draw.line(s, self.color_map_grid, (offset_x, ypix), (offset_x + map_w, ypix), 1)
-        for x in range(cols + 1):
-            xpix = offset_x + x * tile
-            pygame.draw.line(s, self.color_map_grid, (xpix, offset_y), (xpix, offset_y + map_h), 1)
+        # Draw grid background and cells from a cached surface; building it
+        # cell-by-cell in Python is thousands of draw calls per frame, so the
+        # coloring is vectorized in NumPy and only redone when the data moves
+        key = (rows, cols, tile, self.dungeon.version)
+        if self._map_cache is None or key != self._map_cache_key:
+            cell = np.empty((rows, cols, 3), dtype=np.uint8)
+            cell[:] = self.color_map_floor_unseen
+            wall_mask = grid == 1
+            cell[(~wall_mask) & (visited != 0)] = self.color_map_floor_seen
+            cell[wall_mask] = self.color_map_wall
+            scaled = cell.repeat(tile, axis=0).repeat(tile, axis=1)
+            base = pygame.surfarray.make_surface(scaled.swapaxes(0, 1)).convert()
+            # Bake the cell-delineating grid lines in too; they are as static
+            # as the cells and cost rows+cols draw calls per frame otherwise
+            for y in range(rows + 1):
+                ypix = min(y * tile, map_h - 1)
+                pygame.draw.line(base, self.color_map_grid, (0, ypix), (map_w, ypix), 1)
+            for x in range(cols + 1):
+                xpix = min(x * tile, map_w - 1)
+                pygame.draw.line(base, self.color_map_grid, (xpix, 0), (xpix, map_h), 1)
+            self._map_cache = base
+            self._map_cache_key = key
+        s.blit(self._map_cache, (offset_x, offset_y))
 
         # Draw items (gold/weapons)
         for it in getattr(self.dungeon, "items", []):
@@ -467,16 +647,15 @@ class EOBViewPG:
         r = max(3, tile // 3)
         pygame.draw.circle(s, self.color_map_player, (px, py), r)
         # Facing indicator
-        dir_vecs = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-        dx, dy = dir_vecs[p.facing]
+        dx, dy = _DIR_VECS[p.facing]
         tip_x = px + int(dx * r * 1.6)
         tip_y = py + int(dy * r * 1.6)
         pygame.draw.line(s, self.color_map_player, (px, py), (tip_x, tip_y), 2)
 
-        # Title / legend
-        title = self.font_large.render("Dungeon Map", True, self.color_text)
+        # Title / legend (pre-rendered; the strings never change)
+        title = self._map_title
         s.blit(title, (W // 2 - title.get_width() // 2, offset_y - 30))
-        legend = self.font.render("#: wall  • dark: unseen  • light: visited  • dot+arrow: you", True, self.color_text)
+        legend = self._map_legend
         s.blit(legend, (W // 2 - legend.get_width() // 2, offset_y + map_h + 10))
 
     def _wall_color(self, d: int) -> Color:
@@ -484,6 +663,8 @@ class EOBViewPG:
         return self.color_wall[idx]
 
     def _front_rect(self, d: int) -> tuple[int, int, int, int]:
+        if 0 <= d < len(self._front_rects):
+            return self._front_rects[d]
         W, H = self.width, self.height
         mx = self._mx(d)
         my = self._my(d)
@@ -494,23 +675,7 @@ class EOBViewPG:
         pygame.draw.rect(self.screen, self.color_outline, rect, width=2)
 
     def _side_wall(self, d: int, *, left: bool) -> None:
-        W, H = self.width, self.height
-        mx0, my0 = self._mx(d), self._my(d)
-        mx1, my1 = self._mx(d + 1), self._my(d + 1)
-        if left:
-            poly = [
-                (mx0, my0),
-                (mx0, H - my0),
-                (mx1, H - my1),
-                (mx1, my1),
-            ]
-        else:
-            poly = [
-                (W - mx0, my0),
-                (W - mx0, H - my0),
-                (W - mx1, H - my1),
-                (W - mx1, my1),
-            ]
+        poly = self._left_polys[d] if left else self._right_polys[d]
         # Texture-map side wall by tiling and masking to polygon
         base_tile = self.wall_tiles[min(d, len(self.wall_tiles) - 1)]
         tile = base_tile
@@ -521,66 +686,155 @@ class EOBViewPG:
             if self._nearest_front is not None and d <= self._nearest_front:
                 fog_b, fog_a = 1.0, 1.0
             else:
-                fog_b, fog_a = self._fog_params(d, layers)
-            tile = self._tint_surface(base_tile, fog_b)
+                fog_b, fog_a = self._fog_table(layers)[d]
+            tile = self._tint_cached(base_tile, fog_b)
             alpha = int(255 * fog_a)
-        self._blit_tiled_polygon(tile, poly, alpha=alpha)
+            if alpha < 8:
+                # Effectively invisible this deep in the fog; skip the blit
+                return
+        # The polygon and (cached) tint are stable, so the tiled + masked
+        # sprite is too; the tint cache keeps tile ids stable for the key
+        key = (d, left, id(tile))
+        entry = self._side_sprite_cache.get(key)
+        if entry is None:
+            entry = self._build_side_sprite(tile, poly)
+            self._side_sprite_cache[key] = entry
+        sprite, pos = entry
+        sprite.set_alpha(max(0, min(255, alpha)))
+        self.screen.blit(sprite, pos)
         if not self._in_fog_zone(d, layers):
             pygame.draw.polygon(self.screen, self.color_outline, poly, width=2)
 
+    def _build_side_sprite(
+        self, tile: pygame.Surface, poly: tuple[tuple[int, int], ...]
+    ) -> tuple[pygame.Surface, tuple[int, int]]:
+        min_x = min(p[0] for p in poly)
+        max_x = max(p[0] for p in poly)
+        min_y = min(p[1] for p in poly)
+        max_y = max(p[1] for p in poly)
+        w = max(1, max_x - min_x)
+        h = max(1, max_y - min_y)
+        # One C-level texture-mapped fill instead of tiling plus a polygon
+        # mask and a BLEND_RGBA_MULT clip pass
+        tiled = pygame.Surface((w, h), pygame.SRCALPHA)
+        shifted = [(x - min_x, y - min_y) for (x, y) in poly]
+        pygame.gfxdraw.textured_polygon(tiled, shifted, tile, 0, 0)
+        return tiled.convert_alpha(), (min_x, min_y)
+
+    # ----------------- Input handlers -----------------
+    def _menu_move(self, delta: int) -> None:
+        self.menu_index = (self.menu_index + delta) % len(self.menu_items)
+
+    def _menu_select(self) -> bool:
+        # Returns True when the selection should quit the game
+        choice = self.menu_items[self.menu_index]
+        if choice == "Resume":
+            self.menu_open = False
+        elif choice == "Save":
+            self._handle_save()
+        elif choice == "Load":
+            self._handle_load()
+        elif choice == "Quit":
+            return True
+        return False
+
+    def _toggle_map(self) -> None:
+        self.map_open = not self.map_open
+
+    def _toggle_auto_layers(self) -> None:
+        self.auto_layers = not self.auto_layers
+
+    def _toggle_tuning(self) -> None:
+        self.tuning_mode = not self.tuning_mode
+        if not self.tuning_mode:
+            self._save_tuning()
+
     # ----------------- UI Helpers -----------------
-    def _draw_menu(self) -> None:
+    def _build_menu_overlay(self) -> None:
         W, H = self.width, self.height
-        # Dim background
         overlay = pygame.Surface((W, H), pygame.SRCALPHA)
         overlay.fill(self.color_menu_bg)
-        self.screen.blit(overlay, (0, 0))
 
         # Menu box
         box_w, box_h = 360, 240
         box_x, box_y = (W - box_w) // 2, (H - box_h) // 2
-        pygame.draw.rect(self.screen, self.color_menu_box, (box_x, box_y, box_w, box_h), border_radius=8)
-        pygame.draw.rect(self.screen, self.color_outline, (box_x, box_y, box_w, box_h), width=2, border_radius=8)
+        pygame.draw.rect(overlay, self.color_menu_box, (box_x, box_y, box_w, box_h), border_radius=8)
+        pygame.draw.rect(overlay, self.color_outline, (box_x, box_y, box_w, box_h), width=2, border_radius=8)
 
         # Title
         title = self.font_large.render("Menu", True, self.color_text)
-        self.screen.blit(title, (W // 2 - title.get_width() // 2, box_y + 16))
+        overlay.blit(title, (W // 2 - title.get_width() // 2, box_y + 16))
 
-        # Items
+        # Item labels in the non-highlight color
         start_y = box_y + 60
         line_h = 36
         for idx, label in enumerate(self.menu_items):
-            if idx == self.menu_index:
-                # highlight background
-                hx, hy = box_x + 20, start_y + idx * line_h - 6
-                pygame.draw.rect(self.screen, self.color_menu_highlight, (hx, hy, box_w - 40, line_h), border_radius=6)
-                color = (20, 20, 24)
-            else:
-                color = self.color_text
-            surf = self.font_large.render(label, True, color)
-            self.screen.blit(surf, (W // 2 - surf.get_width() // 2, start_y + idx * line_h))
+            surf = self.font_large.render(label, True, self.color_text)
+            overlay.blit(surf, (W // 2 - surf.get_width() // 2, start_y + idx * line_h))
 
         # Footer hint
         hint = self.font.render("↑/↓ to navigate • Enter to select • ESC to close", True, self.color_text)
-        self.screen.blit(hint, (W // 2 - hint.get_width() // 2, box_y + box_h - 28))
+        overlay.blit(hint, (W // 2 - hint.get_width() // 2, box_y + box_h - 28))
+
+        # One fully composed frame per selectable index, so drawing the menu
+        # is a single blit regardless of which entry is highlighted
+        self._menu_frames: list[pygame.Surface] = []
+        for idx, label in enumerate(self.menu_items):
+            frame = overlay.copy()
+            hx, hy = box_x + 20, start_y + idx * line_h - 6
+            pygame.draw.rect(frame, self.color_menu_highlight, (hx, hy, box_w - 40, line_h), border_radius=6)
+            surf = self.font_large.render(label, True, (20, 20, 24))
+            frame.blit(surf, (W // 2 - surf.get_width() // 2, start_y + idx * line_h))
+            self._menu_frames.append(frame.convert_alpha())
+
+    def _draw_menu(self) -> None:
+        self.screen.blit(self._menu_frames[self.menu_index], (0, 0))
+
+    def _render_cached(self, text: str) -> pygame.Surface:
+        # Shared render cache (with the HUD) for small, frequently repeated
+        # strings: toasts and tuning-overlay lines
+        surf = self._hud_cache.get(text)
+        if surf is None:
+            surf = self.font.render(text, True, self.color_text)
+            if len(self._hud_cache) >= 64:
+                self._hud_cache.pop(next(iter(self._hud_cache)))
+            self._hud_cache[text] = surf
+        return surf
 
     def _toast(self, text: str, seconds: float = 1.8) -> None:
         self._toast_text = text
+        # Render once at arm time; the text never changes mid-toast
+        self._toast_surf = self.font.render(text, True, self.color_text)
         self._toast_until = time.time() + seconds
+        self._dirty = True
 
     def _handle_save(self) -> None:
-        try:
-            self.dungeon.save_to_file(self.save_path)
-            self._toast("Game saved.")
-        except Exception as e:
-            self._toast(f"Save failed: {e}")
+        # Snapshot on the main thread — the player can close the menu and
+        # mutate the dungeon on the very next frame — then hand only the
+        # serialize + disk write to a worker so the render loop never stalls
+        data = self.dungeon.to_dict()
+        path = self.save_path
+
+        def work() -> None:
+            try:
+                write_save(data, path)
+                self._pending_toasts.append("Game saved.")
+            except Exception as e:
+                self._pending_toasts.append(f"Save failed: {e}")
+
+        self._toast("Saving...")
+        threading.Thread(target=work, daemon=True).start()
 
     def _handle_load(self) -> None:
         try:
-            if not os.path.exists(self.save_path):
-                self._toast("No save found.")
-                return
-            self.dungeon.load_from_file(self.save_path)
+            path = self.save_path
+            if not os.path.exists(path):
+                # Fall back to a save from before the binary default
+                path = self._legacy_save_path
+                if not os.path.exists(path):
+                    self._toast("No save found.")
+                    return
+            self.dungeon.load_from_file(path)
             self._toast("Game loaded.")
         except Exception as e:
             self._toast(f"Load failed: {e}")
@@ -600,40 +854,31 @@ class EOBViewPG:
                 r = ((x // cell) + (y // cell)) % 2
                 color = c1 if r == 0 else c2
                 pygame.draw.rect(surf, color, (x, y, cell, cell))
-        # Speckle
-        arr = pygame.PixelArray(surf)
-        for _ in range(sz * 16):
-            x = self._rng.randrange(0, sz)
-            y = self._rng.randrange(0, sz)
-            shade = self._rng.randrange(-6, 7)
-            col = surf.unmap_rgb(arr[x, y])
-            r, g, b = col.r, col.g, col.b
-            nr, ng, nb = max(0, min(255, r + shade)), max(0, min(255, g + shade)), max(0, min(255, b + shade))
-            arr[x, y] = surf.map_rgb((nr, ng, nb))
-        del arr
+        # Speckle (vectorized; ~25% of pixels get a small shade nudge)
+        self._speckle(surf, density=0.25, spread=6)
         return surf.convert()
 
+    def _speckle(self, surf: pygame.Surface, *, density: float, spread: int) -> None:
+        # Nudge a random subset of pixels by a small shade in one array pass
+        # instead of thousands of PixelArray map/unmap round trips
+        arr = pygame.surfarray.pixels3d(surf)
+        shape = arr.shape[:2]
+        mask = self._nprng.random(shape) < density
+        shade = self._nprng.integers(-spread, spread + 1, size=shape, dtype=np.int16)
+        arr[mask] = np.clip(arr[mask].astype(np.int16) + shade[mask, None], 0, 255).astype(np.uint8)
+        del arr
+
     def _gen_ceiling_tile(self, sz: int) -> pygame.Surface:
-        # Soft vertical gradient with subtle noise
+        # Soft vertical gradient with subtle noise, computed in one broadcast
+        # instead of a draw.line call per row
         surf = pygame.Surface((sz, sz)).convert()
-        top = self.color_ceiling
-        bot = (max(0, top[0] - 6), max(0, top[1] - 6), max(0, top[2] - 6))
-        for y in range(sz):
-            t = y / (sz - 1)
-            r = int(top[0] * (1 - t) + bot[0] * t)
-            g = int(top[1] * (1 - t) + bot[1] * t)
-            b = int(top[2] * (1 - t) + bot[2] * t)
-            pygame.draw.line(surf, (r, g, b), (0, y), (sz, y))
-        # Speckle
-        arr = pygame.PixelArray(surf)
-        for _ in range(sz * 8):
-            x = self._rng.randrange(0, sz)
-            y = self._rng.randrange(0, sz)
-            shade = self._rng.randrange(-4, 5)
-            col = surf.unmap_rgb(arr[x, y])
-            r, g, b = col.r, col.g, col.b
-            arr[x, y] = surf.map_rgb((max(0, min(255, r + shade)), max(0, min(255, g + shade)), max(0, min(255, b + shade))))
-        del arr
+        top = np.array(self.color_ceiling, dtype=np.float32)
+        bot = np.maximum(top - 6.0, 0.0)
+        t = np.linspace(0.0, 1.0, sz, dtype=np.float32)[:, None]
+        grad = (top * (1.0 - t) + bot * t).astype(np.uint8)  # one color per row
+        pygame.surfarray.blit_array(surf, np.broadcast_to(grad[None, :, :], (sz, sz, 3)))
+        # Speckle (vectorized; ~12% of pixels)
+        self._speckle(surf, density=0.125, spread=4)
         return surf.convert()
 
     def _gen_brick_tile(self, sz: int) -> pygame.Surface:
@@ -656,33 +901,62 @@ class EOBViewPG:
                 x0 = col * brick_w + offset
                 # vertical mortar
                 pygame.draw.rect(surf, mortar, (x0, y0, mortar_t, brick_h))
-        # Subtle per-pixel variation
-        arr = pygame.PixelArray(surf)
-        for y in range(sz):
-            for x in range(sz):
-                if self._rng.random() < 0.06:
-                    shade = self._rng.randrange(-10, 11)
-                    col = surf.unmap_rgb(arr[x, y])
-                    r, g, b = col.r, col.g, col.b
-                    arr[x, y] = surf.map_rgb((max(0, min(255, r + shade)), max(0, min(255, g + shade)), max(0, min(255, b + shade))))
-        del arr
+        # Subtle per-pixel variation (vectorized)
+        self._speckle(surf, density=0.06, spread=10)
         return surf.convert()
 
     def _tint_surface(self, src: pygame.Surface, factor: float) -> pygame.Surface:
-        # Multiply brightness by factor using a copy
-        surf = src.copy().convert()
-        # Create a solid color surface and blend multiply-ish using special_flags
-        tint = pygame.Surface(surf.get_size()).convert()
+        # Multiply brightness by factor using a copy. Alpha sources (monster
+        # sprites) keep their per-pixel alpha — a bare convert() would flatten
+        # it onto black; opaque tiles stay in the fast display format.
+        if src.get_flags() & pygame.SRCALPHA:
+            surf = src.copy()
+        else:
+            surf = src.copy().convert()
+        # Multiply in place; BLEND_MULT on fill only touches RGB, so no
+        # helper tint surface is needed and per-pixel alpha survives
         val = max(0, min(255, int(255 * factor)))
-        tint.fill((val, val, val))
-        surf.blit(tint, (0, 0), special_flags=pygame.BLEND_MULT)
+        surf.fill((val, val, val), special_flags=pygame.BLEND_MULT)
+        return surf
+
+    def _pretile(self, tile: pygame.Surface, w: int, h: int) -> pygame.Surface:
+        # Tile once into a reusable background strip
+        surf = pygame.Surface((w, h)).convert()
+        ts = tile.get_size()
+        for y in range(0, h, ts[1]):
+            for x in range(0, w, ts[0]):
+                surf.blit(tile, (x, y))
+        return surf
+
+    def _tint_cached(self, src: pygame.Surface, factor: float) -> pygame.Surface:
+        # Quantize to 1/16 steps so the flicker and fog ramps reuse a small
+        # set of tinted copies instead of re-tinting every call. BLEND_MULT
+        # cannot brighten, so factors >= 1.0 are the identity.
+        step = round(factor * 16)
+        if step >= 16:
+            return src
+        key = (id(src), step)
+        surf = self._tint_cache.get(key)
+        if surf is None:
+            surf = self._tint_surface(src, step / 16.0)
+            # No eviction: the key space is a handful of source surfaces x 16
+            # brightness steps, and the row/side-sprite/billboard caches key
+            # on id() of these entries, so dropping one could let a recycled
+            # id alias stale pixels
+            self._tint_cache[key] = surf
         return surf
 
     def _blit_tiled(self, tile: pygame.Surface, rect: pygame.Rect, *, brightness: float = 1.0, alpha: int = 255, offset: tuple[int, int] | None = None) -> None:
-        # Optionally apply brightness by blitting a tinted copy once per call
+        # Optionally apply brightness via the shared tinted-copy cache
         if brightness != 1.0:
-            tile = self._tint_surface(tile, brightness)
+            tile = self._tint_cached(tile, brightness)
         ts = tile.get_size()
+        # Tile horizontally once into a cached full-width strip so covering
+        # the rect costs one blit per row rather than one per tile
+        row = self._row_cache.get(id(tile))
+        if row is None:
+            row = self._pretile(tile, self.width + ts[0], ts[1])
+            self._row_cache[id(tile)] = row
         x0, y0, w, h = rect
         ox, oy = (0, 0) if offset is None else (offset[0] % ts[0], offset[1] % ts[1])
         if alpha >= 255:
@@ -691,26 +965,25 @@ class EOBViewPG:
             try:
                 start_y = y0 - oy
                 start_x = x0 - ox
-                for y in range(start_y, y0 + h, ts[1]):
-                    for x in range(start_x, x0 + w, ts[0]):
-                        self.screen.blit(tile, (x, y))
+                self.screen.blits(
+                    [(row, (start_x, y)) for y in range(start_y, y0 + h, ts[1])],
+                    doreturn=False,
+                )
             finally:
                 self.screen.set_clip(prev_clip)
         else:
             patch = pygame.Surface((w, h), pygame.SRCALPHA)
-            start_y = -oy
             start_x = -ox
-            for y in range(start_y, h, ts[1]):
-                for x in range(start_x, w, ts[0]):
-                    patch.blit(tile, (x, y))
+            patch.blits(
+                [(row, (start_x, y)) for y in range(-oy, h, ts[1])],
+                doreturn=False,
+            )
             patch.set_alpha(max(0, min(255, alpha)))
             self.screen.blit(patch, (x0, y0))
 
     def _flicker(self) -> float:
-        # Smooth flicker from combined sines
-        t = pygame.time.get_ticks() / 1000.0
-        v = 0.5 * (math.sin(t * 2.1) + math.sin(t * 2.7 + 1.3))
-        return 0.96 + 0.06 * v  # ~0.90..1.02
+        # Smooth flicker from combined sines, sampled from the LUT (~0.90..1.02)
+        return self._flicker_lut[pygame.time.get_ticks() // 17 % 3600]
 
     def _poly_hatch(self, poly: list[tuple[int, int]], intensity: int = 24) -> None:
         # Draw faint vertical stripes clipped to polygon
@@ -764,7 +1037,8 @@ class EOBViewPG:
     def _scale_surface(self, src: pygame.Surface, w: int, h: int) -> pygame.Surface:
         w = max(1, w)
         h = max(1, h)
-        if w == src.get_width() and h == src.get_height():
+        # A 1px mismatch is imperceptible at billboard sizes; skip smoothscale
+        if abs(w - src.get_width()) <= 1 and abs(h - src.get_height()) <= 1:
             return src
         try:
             return pygame.transform.smoothscale(src, (w, h))
@@ -793,35 +1067,41 @@ class EOBViewPG:
                 wx, wy = self.dungeon.transform_local(d + 1, r_off)
                 if self.dungeon.is_wall(wx, wy):
                     continue
-                # Find a monster at tile
-                mon = None
-                for m in self.dungeon.monsters:
-                    if m.x == wx and m.y == wy:
-                        mon = m
-                        break
+                # The dungeon keeps a (x, y) -> monster index in sync with
+                # movement and deaths; no need to scan the list per tile
+                mon = self.dungeon._monster_at(wx, wy)
                 if mon is None:
                     continue
                 sprite = self._get_monster_sprite(mon.name)
                 alpha = 255
                 if self.fog_enabled:
-                    fog_b, fog_a = self._fog_params(d, layers)
-                    sprite = self._tint_surface(sprite, fog_b)
+                    fog_b, fog_a = self._fog_table(layers)[d]
+                    sprite = self._tint_cached(sprite, fog_b)
                     alpha = int(255 * fog_a)
-                scaled = self._scale_surface(sprite, spr_w, spr_h)
+                skey = (id(sprite), spr_w, spr_h)
+                scaled = self._monster_scale_cache.get(skey)
+                if scaled is None:
+                    scaled = self._scale_surface(sprite, spr_w, spr_h)
+                    self._monster_scale_cache[skey] = scaled
                 scaled.set_alpha(max(0, min(255, alpha)))
                 x = int(cxpos - scaled.get_width() // 2)
                 y = int((fy1 + fy2) // 2 - scaled.get_height() // 2)
                 self.screen.blit(scaled, (x, y))
 
     def _get_monster_sprite(self, name: str) -> pygame.Surface:
-        key = name.lower()
-        if "rat" in key:
-            return self.monster_sprites["rat"]
-        if "skeleton" in key:
-            return self.monster_sprites["skeleton"]
-        if "bat" in key:
-            return self.monster_sprites["bat"]
-        return self.monster_sprites.get("goblin")
+        key = self._sprite_key_cache.get(name)
+        if key is None:
+            low = name.lower()
+            if "rat" in low:
+                key = "rat"
+            elif "skeleton" in low:
+                key = "skeleton"
+            elif "bat" in low:
+                key = "bat"
+            else:
+                key = "goblin"
+            self._sprite_key_cache[name] = key
+        return self.monster_sprites[key]
 
     def _gen_monster_sprites(self, sz: int) -> dict[str, pygame.Surface]:
         sprites: dict[str, pygame.Surface] = {}
@@ -889,29 +1169,28 @@ class EOBViewPG:
         pygame.draw.ellipse(s, dark, (int(sz*0.40), int(sz*0.40), int(sz*0.20), int(sz*0.18)), 1)
         return s.convert_alpha()
 
-    def _process_hold(self, dt: float) -> None:
+    def _process_hold(self, dt: float, keys) -> None:
         if self.menu_open or self.map_open:
             # Do not process movement while UI is open
             for st in self._hold_state.values():
-                st["was_down"] = False
-                st["acc"] = 0.0
+                st.was_down = False
+                st.acc = 0.0
             return
-        keys = pygame.key.get_pressed()
 
         def update(action: str, down: bool, do_step, delay: float, rate: float) -> None:
             st = self._hold_state[action]
             if down:
-                if not st["was_down"]:
-                    st["was_down"] = True
-                    st["acc"] = -delay
+                if not st.was_down:
+                    st.was_down = True
+                    st.acc = -delay
                 else:
-                    st["acc"] += dt
-                    while st["acc"] >= rate:
+                    st.acc += dt
+                    while st.acc >= rate:
                         do_step()
-                        st["acc"] -= rate
+                        st.acc -= rate
             else:
-                st["was_down"] = False
-                st["acc"] = 0.0
+                st.was_down = False
+                st.acc = 0.0
 
         # Mapping: W/Up forward, S/Down back, A/Left turn left, D/Right turn right
         update(
@@ -956,6 +1235,25 @@ class EOBViewPG:
         alpha = 1.0 - t * (1.0 - self.fog_alpha_far)
         return brightness, alpha
 
+    def _fog_table(self, layers: int) -> tuple:
+        # Tabulated _fog_params for every depth at this layer count; the fog
+        # settings only change from tuning keys, so invalidate on config drift
+        cfg = (
+            self.fog_enabled,
+            self.fog_min_start,
+            self.fog_layers,
+            self.fog_far,
+            self.fog_alpha_far,
+        )
+        if cfg != self._fog_cfg:
+            self._fog_lut.clear()
+            self._fog_cfg = cfg
+        tab = self._fog_lut.get(layers)
+        if tab is None:
+            tab = tuple(self._fog_params(d, layers) for d in range(layers))
+            self._fog_lut[layers] = tab
+        return tab
+
     def _in_fog_zone(self, d: int, layers: int) -> bool:
         if not self.fog_enabled:
             return False
@@ -966,41 +1264,47 @@ class EOBViewPG:
         if not self.fog_enabled or layers <= 1:
             return
         start = max(self.fog_min_start, layers - self.fog_layers)
+        # Ring surfaces depend only on geometry and fog config; rebuild the
+        # cache when either drifts, otherwise each ring is a single blit
+        cfg = (self.fog_min_start, self.fog_layers, self.fog_overlay_alpha_far, self._proj_version)
+        if cfg != self._fog_ring_cfg:
+            self._fog_ring_cache.clear()
+            self._fog_ring_cfg = cfg
+        span = max(1, self.fog_layers - 1)
         # Do not overlay nearer than the front hit
         nearest = self._nearest_front if self._nearest_front is not None else -1
         for d in range(max(start, nearest + 1), layers):
-            fx1, fy1, fx2, fy2 = self._front_rect(d)
-            rect = pygame.Rect(fx1, fy1, fx2 - fx1, fy2 - fy1)
-            # Compute overlay alpha per ring
-            span = max(1, self.fog_layers - 1)
             t = min(1.0, max(0.0, (d - start) / span))
             a = int(255 * (t * self.fog_overlay_alpha_far))
             if a <= 0:
                 continue
-            ring = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            ring.fill((0, 0, 0, a))
-            # punch inner hole for next-nearer rectangle
-            if d > 0:
-                inx1, iny1, inx2, iny2 = self._front_rect(d - 1)
-                inner = pygame.Rect(inx1 - fx1, iny1 - fy1, (inx2 - inx1), (iny2 - iny1))
-                if inner.width > 0 and inner.height > 0:
-                    pygame.draw.rect(ring, (0, 0, 0, 0), inner)
+            rect = self._front_rect_objs[d]
+            ring = self._fog_ring_cache.get((d, layers))
+            if ring is None:
+                fx1, fy1 = rect.x, rect.y
+                ring = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+                ring.fill((0, 0, 0, a))
+                # punch inner hole for next-nearer rectangle
+                if d > 0:
+                    inx1, iny1, inx2, iny2 = self._front_rect(d - 1)
+                    inner = pygame.Rect(inx1 - fx1, iny1 - fy1, (inx2 - inx1), (iny2 - iny1))
+                    if inner.width > 0 and inner.height > 0:
+                        pygame.draw.rect(ring, (0, 0, 0, 0), inner)
+                self._fog_ring_cache[(d, layers)] = ring
             self.screen.blit(ring, rect.topleft)
 
     def _geom_depth_limit(self) -> int:
         # Find largest d such that the rectangle still has drawable area
         # Avoid infinite depth by capping to a reasonable number of tiles.
-        max_d = 256
         last_d = 1
-        for d in range(1, max_d + 1):
+        for d in range(1, _MAX_DEPTH + 1):
             x1, y1, x2, y2 = self._front_rect(d)
             if (x2 - x1) <= 2 or (y2 - y1) <= 2:
                 break
             last_d = d
         return last_d
 
-    def _update_tuning_held(self, dt: float) -> None:
-        keys = pygame.key.get_pressed()
+    def _update_tuning_held(self, dt: float, keys) -> None:
         changed = False
         # Far X: [ decrease, ] increase
         if keys[pygame.K_LEFTBRACKET]:
@@ -1095,8 +1399,62 @@ class EOBViewPG:
 
         if changed:
             self._clamp_anchors()
+            # Held adjustments bypass the event queue, so mark the frame
+            # dirty ourselves or the new geometry waits for the next flicker step
+            self._dirty = True
 
     def _mx(self, d: int) -> int:
+        if 0 <= d < len(self._mx_table):
+            return self._mx_table[d]
+        return self._mx_raw(d)
+
+    def _my(self, d: int) -> int:
+        if 0 <= d < len(self._my_table):
+            return self._my_table[d]
+        return self._my_raw(d)
+
+    def _rebuild_projection(self) -> None:
+        # Bake per-depth horizontal/vertical insets, front rects, and side-wall
+        # polygons. Called whenever the anchors or screen geometry change.
+        W, H = self.width, self.height
+        n = _MAX_DEPTH + 2  # +1 so side polys can reference depth d+1
+        mx = [self._mx_raw(d) for d in range(n)]
+        my = [self._my_raw(d) for d in range(n)]
+        self._mx_table = mx
+        self._my_table = my
+        self._front_rects = [
+            (mx[d], my[d], W - mx[d], H - my[d]) for d in range(_MAX_DEPTH + 1)
+        ]
+        # Same rects as ready-made pygame.Rect objects for the blit paths
+        self._front_rect_objs = [
+            pygame.Rect(mx[d], my[d], W - 2 * mx[d], H - 2 * my[d])
+            for d in range(_MAX_DEPTH + 1)
+        ]
+        self._left_polys = [
+            (
+                (mx[d], my[d]),
+                (mx[d], H - my[d]),
+                (mx[d + 1], H - my[d + 1]),
+                (mx[d + 1], my[d + 1]),
+            )
+            for d in range(_MAX_DEPTH + 1)
+        ]
+        self._right_polys = [
+            (
+                (W - mx[d], my[d]),
+                (W - mx[d], H - my[d]),
+                (W - mx[d + 1], H - my[d + 1]),
+                (W - mx[d + 1], my[d + 1]),
+            )
+            for d in range(_MAX_DEPTH + 1)
+        ]
+        # Masked side-wall sprites are shaped by these polygons, so any
+        # projection change invalidates them; built lazily in _side_wall
+        self._side_sprite_cache: dict[tuple[int, bool, int], tuple[pygame.Surface, tuple[int, int]]] = {}
+        self._monster_scale_cache = {}
+        self._proj_version += 1
+
+    def _mx_raw(self, d: int) -> int:
         # Vanishing-point mode: converge towards center with distance.
         if getattr(self, "use_vanishing", False):
             W = self.width
@@ -1111,7 +1469,7 @@ class EOBViewPG:
         idx = min(max(0, d), len(anchors) - 1)
         return int(anchors[idx])
 
-    def _my(self, d: int) -> int:
+    def _my_raw(self, d: int) -> int:
         # Vanishing-point mode: tie vertical convergence to horizontal to keep edges straight
         if getattr(self, "use_vanishing", False):
             H = self.height
@@ -1119,7 +1477,7 @@ class EOBViewPG:
             far_mx = max(1, self.margins_x[-1])
             far_my = max(1, self.margins_y[-1])
             r = min((H // 2 - 1) / far_mx, far_my / far_mx)
-            mx = self._mx(d)
+            mx = self._mx_raw(d)
             return int(min(H // 2 - 1, r * mx))
         # Anchor mode fallback
         anchors = self.margins_y
@@ -1141,12 +1499,14 @@ class EOBViewPG:
         for i in range(1, len(self.margins_y)):
             if self.margins_y[i] < self.margins_y[i - 1]:
                 self.margins_y[i] = self.margins_y[i - 1]
+        self._rebuild_projection()
 
     def _load_tuning(self) -> None:
         try:
             if os.path.exists(self.tuning_path):
-                with open(self.tuning_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(self.tuning_path, "rb") as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 layers = int(data.get("layers", self.layers))
                 mx = data.get("margins_x")
                 my = data.get("margins_y")
@@ -1167,8 +1527,12 @@ class EOBViewPG:
                 "margins_x": self.margins_x,
                 "margins_y": self.margins_y,
             }
-            with open(self.tuning_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2).encode("utf-8")
+            with open(self.tuning_path, "wb") as f:
+                f.write(payload)
             self._toast("Tuning saved.")
         except Exception as e:
             self._toast(f"Save failed: {e}")
@@ -1186,7 +1550,7 @@ class EOBViewPG:
         ]
         y = 10
         for line in lines:
-            surf = self.font.render(line, True, self.color_text)
+            surf = self._render_cached(line)
             self.screen.blit(surf, (10, y))
             y += 22
 